@@ -0,0 +1,187 @@
+import concurrent.futures
+import time
+
+from subscription_common import bad_requests, client, get_application, loads, logger, resp
+
+# Subscriptions in a batch request are added concurrently
+_MAX_WORKERS = 10
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+
+# Keep in step with maxItems in SubscriptionModel
+_MAX_BATCH_SIZE = 20
+# API Gateway gives up on the integration after 29 seconds while the function
+# keeps running, so a batch must answer well before then. No new item is
+# started once less than _SUBMIT_CUTOFF_MS is left, and items still running
+# when _RESPONSE_MARGIN_MS is left are reported without their result.
+_API_GATEWAY_TIMEOUT_MS = 29000
+_SUBMIT_CUTOFF_MS = 10000
+_RESPONSE_MARGIN_MS = 2000
+
+_SUBSCRIPTION_TYPES = frozenset({'Q_BUSINESS', 'Q_LITE'})
+_ASSIGNMENT_TYPES = frozenset({'GROUP', 'USER'})
+
+_ERR_ADD_REQUIRED = 'assignmentType, assignmentId, and subscriptionType are required for ADD action'
+_ERR_SUBSCRIPTION_TYPE = 'Invalid subscription type. Must be Q_BUSINESS or Q_LITE'
+_ERR_ASSIGNMENT_TYPE = 'Invalid assignment type. Must be GROUP or USER'
+_ERR_NOT_OBJECT = 'Each subscription must be a JSON object'
+_ERR_BATCH_SIZE = f'A batch must contain between 1 and {_MAX_BATCH_SIZE} subscriptions'
+_BAD_REQUESTS = bad_requests(_ERR_ADD_REQUIRED, _ERR_SUBSCRIPTION_TYPE, _ERR_ASSIGNMENT_TYPE, _ERR_NOT_OBJECT,
+                             _ERR_BATCH_SIZE)
+
+_ERR_NOT_STARTED = 'Not started: the request ran out of time. Retry this subscription'
+_ERR_STILL_RUNNING = 'Timed out waiting for the result: the subscription may still be created. Check before retrying'
+
+def _bad_request(message):
+    logger.error(message)
+    return _BAD_REQUESTS[message]
+
+def lambda_handler(event, context):
+    """
+    Lambda handler for POST requests that add a subscription.
+    The body is either a single subscription object or an array of them.
+
+    Args:
+        event (dict): API Gateway event containing the JSON request body
+        context (object): Lambda context object
+
+    Returns:
+        dict: API Gateway response with status code, headers, and body
+    """
+    try:
+        params = loads(event['body']) if event.get('body') else {}
+
+        if isinstance(params, list):
+            if not 1 <= len(params) <= _MAX_BATCH_SIZE:
+                return _bad_request(_ERR_BATCH_SIZE)
+            return resp(*add_subscriptions(params, context))
+
+        error = _validate(params)
+        if error:
+            return _bad_request(error)
+
+        result = _add(params)
+        logger.info("Subscription added successfully: %s", result)
+        return resp(200, result)
+
+    except Exception as e:
+        return resp(500, {'error': str(e)})
+
+def _validate(params):
+    # Returns the validation error message for one subscription, or None
+    if not isinstance(params, dict):
+        return _ERR_NOT_OBJECT
+
+    logger.info("Event parameters - region: %s, applicationId: %s, assignmentType: %s, assignmentId: %s, subscriptionType: %s",
+                params.get('region'), params.get('applicationId'), params.get('assignmentType'),
+                params.get('assignmentId'), params.get('subscriptionType'))
+
+    # Validate required parameters for ADD
+    if not all([params.get('applicationId'), params.get('assignmentType'),
+                params.get('assignmentId'), params.get('subscriptionType')]):
+        return _ERR_ADD_REQUIRED
+
+    # Validate subscription type
+    if params['subscriptionType'] not in _SUBSCRIPTION_TYPES:
+        return _ERR_SUBSCRIPTION_TYPE
+
+    # Validate assignment type
+    if params['assignmentType'] not in _ASSIGNMENT_TYPES:
+        return _ERR_ASSIGNMENT_TYPE
+
+    return None
+
+def _add(params):
+    return add_subscription(
+        params.get('region'),
+        params['applicationId'],
+        params['assignmentType'],
+        params['assignmentId'],
+        params['subscriptionType']
+    )
+
+def add_subscriptions(items, context):
+    # Invalid items are reported without calling AWS, valid ones are added
+    # concurrently. Failures are collected per item so the rest still succeed.
+    # Returns the response status code and body.
+    deadline = time.monotonic() + min(context.get_remaining_time_in_millis(), _API_GATEWAY_TIMEOUT_MS) / 1000
+
+    def remaining_ms():
+        return (deadline - time.monotonic()) * 1000
+
+    results, errors, valid = [], [], []
+    rejected = 0
+    for index, params in enumerate(items):
+        error = _validate(params)
+        if error:
+            logger.error("Subscription %s rejected: %s", index, error)
+            errors.append({'index': index, 'error': error})
+            rejected += 1
+        else:
+            valid.append((index, params))
+
+    # Resolve each application ARN once up front. lru_cache does not coalesce
+    # concurrent misses, so the workers would otherwise all call GetApplication.
+    # A failed lookup is retried and reported by the items that need it.
+    warmups = [_pool.submit(get_application, applicationId)
+               for applicationId in {params['applicationId'] for _, params in valid}]
+    concurrent.futures.wait(warmups, timeout=max(0, remaining_ms() - _SUBMIT_CUTOFF_MS) / 1000)
+
+    # Items are submitted as workers free up rather than queued all at once, so
+    # nothing new starts after the cutoff
+    pending, running = [], set()
+    for position, (index, params) in enumerate(valid):
+        while len(running) >= _MAX_WORKERS and remaining_ms() > _SUBMIT_CUTOFF_MS:
+            _, running = concurrent.futures.wait(
+                running, timeout=(remaining_ms() - _SUBMIT_CUTOFF_MS) / 1000,
+                return_when=concurrent.futures.FIRST_COMPLETED)
+        if remaining_ms() <= _SUBMIT_CUTOFF_MS:
+            for index, _ in valid[position:]:
+                logger.error("Subscription %s not started: out of time", index)
+                errors.append({'index': index, 'error': _ERR_NOT_STARTED})
+            break
+        future = _pool.submit(_add, params)
+        running.add(future)
+        pending.append((index, future))
+
+    concurrent.futures.wait(running, timeout=max(0, remaining_ms() - _RESPONSE_MARGIN_MS) / 1000)
+    for index, future in pending:
+        if not future.done():
+            logger.error("Subscription %s still running at the response deadline", index)
+            errors.append({'index': index, 'error': _ERR_STILL_RUNNING})
+            continue
+        try:
+            results.append({'index': index, 'result': future.result()})
+        except Exception as e:
+            logger.error("Subscription %s failed: %s", index, e)
+            errors.append({'index': index, 'error': str(e)})
+
+    errors.sort(key=lambda error: error['index'])
+    # 207 when only some items succeeded. When none did, the request is a bad
+    # request only if every item failed validation.
+    if not errors:
+        status = 200
+    elif results:
+        status = 207
+    elif rejected == len(items):
+        status = 400
+    else:
+        status = 500
+    return status, {'results': results, 'errors': errors}
+
+def add_subscription(region, applicationId, assignmentType, assignmentId, subscriptionType):
+    # Create IAM Identity Center application assignment
+    client('sso-admin').create_application_assignment(
+        ApplicationArn=get_application(applicationId),
+        PrincipalId=assignmentId,
+        PrincipalType=assignmentType
+    )
+    logger.info("Application assignment created successfully: %s", assignmentId)
+
+    # Subscription APIs are called against the region passed in the request
+    response = client('qbusiness', region).create_subscription(
+        applicationId=applicationId,
+        principal={assignmentType.lower(): assignmentId},
+        type=subscriptionType
+    )
+    logger.info("Subscription created successfully: %s", response['subscriptionId'])
+    return f"subscriptionId:{response['subscriptionId']}"
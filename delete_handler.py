@@ -0,0 +1,85 @@
+import concurrent.futures
+
+from subscription_common import bad_requests, client, get_application, logger, resp
+
+_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+_ERR_DELETE_REQUIRED = 'assignmentType and assignmentId are required for DELETE action'
+_BAD_REQUESTS = bad_requests(_ERR_DELETE_REQUIRED)
+
+def _bad_request(message):
+    logger.error(message)
+    return _BAD_REQUESTS[message]
+
+def lambda_handler(event, context):
+    """
+    Lambda handler for DELETE requests that remove a subscription.
+
+    Args:
+        event (dict): API Gateway event containing the query string parameters
+        context (object): Lambda context object
+
+    Returns:
+        dict: API Gateway response with status code, headers, and body
+    """
+    try:
+        params = event.get('queryStringParameters') or {}
+
+        region = params.get('region')
+        applicationId = params.get('applicationId')
+        assignmentType = params.get('assignmentType')
+        assignmentId = params.get('assignmentId')
+        subscriptionId = params.get('subscriptionId')
+        logger.info("Event parameters - region: %s, applicationId: %s, assignmentType: %s, assignmentId: %s, subscriptionId: %s",
+                    region, applicationId, assignmentType, assignmentId, subscriptionId)
+
+        if not all([applicationId, assignmentType, assignmentId]):
+            return _bad_request(_ERR_DELETE_REQUIRED)
+
+        result = delete_subscription(region, applicationId, assignmentType, assignmentId, subscriptionId)
+        logger.info(result)
+        return resp(200, result)
+
+    except Exception as e:
+        return resp(500, {'error': str(e)})
+
+def delete_subscription(region, applicationId, assignmentType, assignmentId, subscriptionId=None):
+    # Resolve the Identity Center application ARN while the subscription is being removed
+    app_future = _pool.submit(get_application, applicationId)
+
+    # Subscription APIs are called against the region passed in the request
+    qclient = client('qbusiness', region)
+
+    # Callers that kept the id returned by ADD can skip the lookup entirely
+    if not subscriptionId:
+        #Find the Subscription Id for the given Application and User/Group,
+        #streaming pages and stopping at the first match
+        key = assignmentType.lower()
+        paginator = qclient.get_paginator('list_subscriptions')
+        for page in paginator.paginate(applicationId=applicationId):
+            # subscriptions is optional in the ListSubscriptions output
+            for subscription in page.get('subscriptions', ()):
+                try:
+                    principalId = subscription['principal'][key]
+                except KeyError:
+                    # Principal of the other assignment type
+                    continue
+                if principalId == assignmentId:
+                    subscriptionId = subscription['subscriptionId']
+                    break
+            if subscriptionId:
+                break
+    if not subscriptionId:
+        logger.error("Subscription not found for the given application and principal")
+        raise Exception(f"Subscription not found for the given application and principal")
+
+    #Now cancel the subscription
+    qclient.cancel_subscription(applicationId=applicationId, subscriptionId=subscriptionId)
+    logger.info("Subscription deleted successfully: %s", subscriptionId)
+    #Remove IDC App assignment
+    client('sso-admin').delete_application_assignment(
+                ApplicationArn=app_future.result(),
+                PrincipalId=assignmentId,
+                PrincipalType=assignmentType)
+    logger.info("Application assignment deleted successfully: %s", assignmentId)
+    return "{status:'Application assignment deleted successfully'}"
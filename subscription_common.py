@@ -0,0 +1,86 @@
+import boto3
+from botocore.config import Config
+import functools
+import json
+import os
+import logging
+import threading
+
+try:
+    import orjson
+
+    def dumps(obj):
+        # API Gateway expects the body as a string, orjson returns bytes
+        return orjson.dumps(obj).decode()
+
+    loads = orjson.loads
+except ImportError:
+    # Fall back to the standard library when the layer does not ship orjson
+    dumps = json.dumps
+    loads = json.loads
+
+logger = logging.getLogger()
+# Set from the LogLevel stack parameter. Use WARNING to drop the per-request
+# INFO records in production.
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# Keep idle connections alive between warm invocations, fail fast on slow
+# endpoints and retry throttling with the standard retry mode
+_CLIENT_CONFIG = Config(
+    retries={'mode': 'standard', 'max_attempts': 3},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=10
+)
+_clients = {}
+_clients_lock = threading.Lock()
+
+@functools.cache
+def _session():
+    # Defer session creation to the first client, so requests rejected during
+    # validation never build one. Clients sign every request from its
+    # refreshable credentials via get_frozen_credentials(), so rotated Lambda
+    # role credentials are picked up without extra handling.
+    return boto3.Session()
+
+HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
+def client(name, region=None):
+    # Create boto3 clients on first use so requests rejected during validation
+    # never pay for client construction
+    key = (name, region)
+    # Client construction on a shared session is not thread-safe
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = _session().client(name, region_name=region, config=_CLIENT_CONFIG)
+        return _clients[key]
+
+def _prime():
+    # Build the default-region clients during initialization so their loaded
+    # service models and endpoint resolvers are captured in the snapshot
+    client('qbusiness')
+    client('sso-admin')
+
+# SnapStart and provisioned concurrency initialize ahead of any request, so the
+# priming cost never lands on a caller. On-demand cold starts stay lazy.
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') in ('snap-start', 'provisioned-concurrency'):
+    _prime()
+
+@functools.lru_cache(maxsize=128)
+def get_application(applicationId):
+    # The Identity Center application ARN never changes for a given Q Business
+    # application, so cache it for the lifetime of the warm container.
+    return client('qbusiness').get_application(applicationId=applicationId)["identityCenterApplicationArn"]
+
+def bad_requests(*messages):
+    # Validation error responses are built and serialized once at import time
+    return {
+        message: {'statusCode': 400, 'headers': HEADERS, 'body': dumps({'error': message})}
+        for message in messages
+    }
+
+def resp(code, obj):
+    return {'statusCode': code, 'headers': HEADERS, 'body': dumps(obj)}